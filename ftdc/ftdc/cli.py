@@ -1,19 +1,159 @@
 """Command-line interface for FTDC tool."""
 
+import logging
+import queue
+import shlex
 import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, wait
 from pathlib import Path
+from typing import TypeVar
 
 import click
 
 from .errors import FTDCError
+from .models import MatchMode
 from .service import FTDCService
 
+T = TypeVar("T")
+
+# How long an aborted command waits for its worker to wind down, so late
+# output does not land after "Aborted." or on the next shell prompt
+ABORT_GRACE_PERIOD = 5.0
+
+
+class _DownloadProgress:
+    """Throttled single-line download progress on stderr.
+
+    Archives are downloaded one after another, so the line tracks the current
+    job only and a new line starts when the next job begins.
+    """
+
+    def __init__(self, interval: float = 0.2):
+        self._interval = interval
+        self._job_id: str | None = None
+        self._last: tuple[int, int] | None = None
+        self._last_render = 0.0
+        self._line_open = False
+        self._lock = threading.Lock()
+
+    def __call__(self, job_id: str, received: int, total: int) -> None:
+        with self._lock:
+            if job_id != self._job_id:
+                self.finish()
+                self._job_id = job_id
+                self._last = None
+                self._last_render = 0.0
+            if self._last == (received, total):
+                return
+            self._last = (received, total)
+            finished = bool(total) and received >= total
+
+            now = time.monotonic()
+            if not finished and now - self._last_render < self._interval:
+                return
+            self._last_render = now
+
+            line = f"\rDownloaded {received / 1e6:.1f} MB"
+            if total:
+                line += f" of {total / 1e6:.1f} MB ({received / total:.0%})"
+            click.echo(line, err=True, nl=False)
+            self._line_open = True
+
+            if finished:
+                self.finish()
+
+    def finish(self) -> None:
+        """End the progress line so later output starts on a fresh line."""
+        if self._line_open:
+            click.echo(err=True)
+            self._line_open = False
+
+
+class _Worker:
+    """One long-lived daemon thread that runs blocking service calls.
+
+    Every call runs on the same thread, so HTTPDigestAuth, which keeps its
+    nonce per thread, answers the 401 challenge once and reuses the nonce for
+    later downloads in `ftdc shell`. Being a daemon thread, it does not hold
+    up interpreter exit once a command is aborted.
+    """
+
+    def __init__(self):
+        self._calls: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., T], *args, **kwargs) -> Future[T]:
+        """Queue a call on the worker thread and return its future."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ftdc-worker", daemon=True
+                )
+                self._thread.start()
+
+        future: Future[T] = Future()
+        self._calls.put((future, fn, args, kwargs))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            future, fn, args, kwargs = self._calls.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+_worker = _Worker()
+
+
+def _run_interruptible(
+    fn: Callable[..., T], *args, on_interrupt: Callable[[], None], **kwargs
+) -> T:
+    """Run a blocking call on the worker thread so Ctrl-C is handled promptly.
+
+    The main thread only waits on the result in short slices, so
+    KeyboardInterrupt is raised here right away instead of after the worker's
+    current socket read or sleep. On Ctrl-C, on_interrupt is called to stop
+    the call, and the worker is given a short grace period to unwind before
+    KeyboardInterrupt propagates.
+    """
+    future = _worker.submit(fn, *args, **kwargs)
+
+    try:
+        while not future.done():
+            wait([future], timeout=0.25)
+    except KeyboardInterrupt:
+        on_interrupt()
+        wait([future], timeout=ABORT_GRACE_PERIOD)
+        raise
+
+    return future.result()
+
 
 @click.group()
 @click.version_option(version="0.1.0")
-def main():
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    default=False,
+    help="Show debug output, including HTTP requests and retries",
+)
+def main(verbose: bool):
     """FTDC tool for MongoDB Atlas - Download and convert FTDC diagnostic data."""
-    pass
+    # Status messages go to stderr so stdout stays clean for pipelines
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format="%(message)s",
+        stream=sys.stderr,
+    )
 
 
 @main.command()
@@ -27,7 +167,11 @@ def main():
     "--replica-set-name",
     "-r",
     required=True,
-    help="Replica set or shard name (e.g., 'atlas-cluster-shard-0' or 'shard-00')",
+    multiple=True,
+    help=(
+        "Replica set or shard name (e.g., 'atlas-cluster-shard-0' or 'shard-00'); "
+        "repeat to download several shards in one batch"
+    ),
 )
 @click.option(
     "--public",
@@ -57,13 +201,34 @@ def main():
     default=None,
     help="Output directory for downloaded file (default: current directory)",
 )
+@click.option(
+    "--extract",
+    "-x",
+    is_flag=True,
+    default=False,
+    help="Extract the archive while downloading instead of saving the tar.gz",
+)
+@click.option(
+    "--match",
+    "-m",
+    type=click.Choice([mode.value for mode in MatchMode]),
+    default=MatchMode.CONTAINS.value,
+    help=(
+        "Match the replica set name exactly or as a substring of Atlas "
+        "process names (default: contains)"
+    ),
+)
+@click.pass_context
 def download(
+    ctx: click.Context,
     group_key: str,
-    replica_set_name: str,
+    replica_set_name: tuple[str, ...],
     public: str,
     private: str,
     size: int,
     output_dir: Path | None,
+    extract: bool,
+    match: str,
 ):
     """Download FTDC data from a MongoDB Atlas cluster.
 
@@ -85,27 +250,148 @@ def download(
         \b
         # Download with custom size to output directory
         ftdc download -g PROJECT_ID -r shard-00 -p KEY -P SECRET -s 50000000 -o ./data
+
+        \b
+        # Extract the FTDC files directly, without keeping the tar.gz
+        ftdc download -g PROJECT_ID -r shard-00 -x -o ./data
+
+        \b
+        # Download several shards of a sharded cluster in one batch
+        ftdc download -g PROJECT_ID -r shard-00 -r shard-01 -r shard-02
     """
-    try:
+    progress = _DownloadProgress()
+    cancel = threading.Event()
+
+    # `ftdc shell` hands in its long-lived service so connections are reused
+    if isinstance(ctx.obj, FTDCService):
+        service = ctx.obj
+    else:
         service = FTDCService(public, private)
 
-        file_path = service.get_ftdc_data(
+    def abort() -> None:
+        cancel.set()
+        service.abort()
+
+    try:
+        file_paths = _run_interruptible(
+            service.get_ftdc_data_for_replica_sets,
             group_key=group_key,
-            replica_set_name=replica_set_name,
+            replica_set_names=replica_set_name,
             byte_size=size,
             output_dir=output_dir,
+            extract=extract,
+            match=MatchMode(match),
+            progress=progress,
+            cancel=cancel,
+            on_interrupt=abort,
         )
+        progress.finish()
 
-        click.echo(f"\n Downloaded to: {file_path}")
+        click.echo()
+        for file_path in file_paths:
+            click.echo(f" Downloaded to: {file_path}")
 
+    except KeyboardInterrupt:
+        progress.finish()
+        click.echo("Aborted.", err=True)
+        sys.exit(130)
     except FTDCError as e:
+        progress.finish()
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     except Exception as e:
+        progress.finish()
         click.echo(f"Unexpected error: {e}", err=True)
         sys.exit(1)
 
 
+@main.command()
+@click.option(
+    "--group-key",
+    "-g",
+    required=True,
+    help="MongoDB Atlas project/group ID (found in Atlas UI URL)",
+)
+@click.option(
+    "--public",
+    "-p",
+    required=True,
+    envvar="ATLAS_PUBLIC_KEY",
+    help="Atlas API public key (or set ATLAS_PUBLIC_KEY env var)",
+)
+@click.option(
+    "--private",
+    "-P",
+    required=True,
+    envvar="ATLAS_PRIVATE_KEY",
+    help="Atlas API private key (or set ATLAS_PRIVATE_KEY env var)",
+)
+def shell(group_key: str, public: str, private: str):
+    """Run several downloads over one Atlas connection.
+
+    Starts an interactive prompt that accepts `download` commands with the
+    same options as `ftdc download`, using the group key and API keys given
+    here. All commands share one HTTP session and run on one worker thread,
+    so pooled connections, their TLS sessions and the digest auth nonce carry
+    over from one download to the next. Ctrl-C aborts the current download
+    and returns to the prompt. Type `exit` or press Ctrl-D to leave.
+
+    Examples:
+
+        \b
+        ftdc shell -g PROJECT_ID
+        ftdc> download -r shard-00
+        ftdc> download -r shard-01 -x -o ./data
+        ftdc> exit
+    """
+    service = FTDCService(public, private)
+    credentials = ["--group-key", group_key, "--public", public, "--private", private]
+
+    while True:
+        try:
+            line = input("ftdc> ")
+        except KeyboardInterrupt:
+            click.echo()
+            continue
+        except EOFError:
+            click.echo()
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            continue
+
+        if not args:
+            continue
+
+        command, *options = args
+        if command in ("exit", "quit"):
+            break
+        if command != "download":
+            click.echo(
+                f"Error: Unknown command '{command}' (expected 'download' or 'exit')",
+                err=True,
+            )
+            continue
+
+        try:
+            download.main(
+                credentials + options,
+                prog_name="download",
+                standalone_mode=False,
+                obj=service,
+            )
+        except click.ClickException as e:
+            e.show()
+        except (click.Abort, KeyboardInterrupt):
+            click.echo("\nAborted.", err=True)
+        except SystemExit:
+            # download reports its own errors before exiting
+            pass
+
+
 @main.command()
 def convert():
     """Convert FTDC data to human-readable format.
@@ -26,6 +26,11 @@ class DownloadError(FTDCError):
     pass
 
 
+class DownloadCancelledError(FTDCError):
+    """Raised when a download is cancelled before it completes."""
+    pass
+
+
 class AuthenticationError(FTDCError):
     """Raised when authentication fails."""
     pass
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import NotRequired, TypedDict
 
 
 class JobState(str, Enum):
@@ -14,27 +14,31 @@ class JobState(str, Enum):
     EXPIRED = "EXPIRED"
 
 
-@dataclass
-class Shard:
-    """Represents a MongoDB shard/process."""
-    user_alias: str
-    type_name: str
-    replica_set_name: Optional[str] = None
+class MatchMode(str, Enum):
+    """How a replica set name is matched against Atlas processes."""
+    EXACT = "exact"
+    CONTAINS = "contains"
 
 
-@dataclass
-class Clusters:
+class Shard(TypedDict):
+    """Represents a MongoDB shard/process, as returned by the API."""
+    userAlias: str
+    typeName: str
+    replicaSetName: NotRequired[str]
+
+
+class Clusters(TypedDict):
     """Response from the processes endpoint."""
     results: list[Shard]
 
 
-@dataclass
+@dataclass(slots=True)
 class JobId:
     """Response from creating a log collection job."""
     id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class JobStatus:
     """Response from checking job status."""
     id: str
@@ -42,22 +46,10 @@ class JobStatus:
     status: str
 
 
-@dataclass
-class LogCollectionJob:
+class LogCollectionJob(TypedDict):
     """Payload for creating a log collection job."""
-    resource_type: str
-    resource_name: str
+    resourceType: str
+    resourceName: str
     redacted: bool
-    size_requested_per_file_bytes: int
-    log_types: list[str]
-
-    @classmethod
-    def create(cls, replica_set: str, byte_size: int) -> "LogCollectionJob":
-        """Create a log collection job payload."""
-        return cls(
-            resource_type="REPLICASET",
-            resource_name=replica_set,
-            redacted=True,
-            size_requested_per_file_bytes=byte_size,
-            log_types=["FTDC"],
-        )
+    sizeRequestedPerFileBytes: int
+    logTypes: list[str]
@@ -1,23 +1,128 @@
 """FTDC download service for MongoDB Atlas."""
 
+import io
+import logging
+import os
+import shutil
+import tarfile
+import threading
 import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
+from urllib3.util.retry import Retry
+
+try:
+    # ISA-L's SIMD inflate is several times faster than zlib on large archives
+    from isal import igzip as gzip
+    from isal.isal_zlib import error as inflate_error
+except ImportError:
+    import gzip
+    from zlib import error as inflate_error
+
+try:
+    # orjson parses large /processes responses several times faster
+    import orjson as json
+except ImportError:
+    import json
 
 from .errors import (
+    DownloadCancelledError,
     DownloadError,
     JobCreationError,
     JobStatusError,
     ReplicaSetNotFoundError,
 )
-from .models import Clusters, JobId, JobState, JobStatus, LogCollectionJob, Shard
+from .models import Clusters, JobId, JobState, LogCollectionJob, MatchMode, Shard
 
 
+logger = logging.getLogger(__name__)
+
 MONGODB_API_BASE_URL = "https://cloud.mongodb.com/api/atlas/v1.0/groups"
 
+# Transient Atlas errors worth retrying. POST is left out of the retried
+# methods so a 5xx during job creation can never create a duplicate job.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset(["GET", "HEAD"])
+
+# (connect, read) timeouts in seconds for every Atlas request. Without them a
+# stalled call would block the CLI's worker thread, and every later command
+# queued behind it, indefinitely. The read timeout bounds each socket read,
+# not a whole archive download.
+REQUEST_TIMEOUT = (10, 30)
+
+# Read/write size for archive downloads. Large chunks keep the number of
+# socket reads and file writes low on multi-GB FTDC archives.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Called with (job_id, bytes_received, total_bytes) as an archive downloads;
+# total_bytes is 0 when Atlas sends no Content-Length.
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def _check_cancelled(cancel: Optional[threading.Event]) -> None:
+    """Raise DownloadCancelledError once the cancel event has been set."""
+    if cancel is not None and cancel.is_set():
+        raise DownloadCancelledError("Download cancelled")
+
+
+class _DownloadReader(io.RawIOBase):
+    """Raw stream over a streaming response that reports download progress.
+
+    Implements both read() and readinto(), since the stdlib and ISA-L gzip
+    readers pull data through different methods. Every read checks the cancel
+    event, so a transfer cut off by FTDCService.abort() ends in
+    DownloadCancelledError rather than a connection error or a short read.
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        job_id: str,
+        progress: Optional[ProgressCallback],
+        cancel: Optional[threading.Event],
+    ):
+        super().__init__()
+        self._raw = response.raw
+        self._job_id = job_id
+        self._progress = progress
+        self._cancel = cancel
+        self._total = int(response.headers.get("Content-Length", 0))
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        _check_cancelled(self._cancel)
+        try:
+            data = self._raw.read(size)
+        finally:
+            _check_cancelled(self._cancel)
+        if data:
+            self._report()
+        return data
+
+    def readinto(self, buffer) -> int:
+        _check_cancelled(self._cancel)
+        try:
+            count = self._raw.readinto(buffer)
+        finally:
+            _check_cancelled(self._cancel)
+        if count:
+            self._report()
+        return count
+
+    def _report(self) -> None:
+        if self._progress is not None:
+            # tell() counts bytes off the wire, which is what Content-Length
+            # measures
+            self._progress(self._job_id, self._raw.tell(), self._total)
+
 
 class FTDCService:
     """Service for downloading FTDC data from MongoDB Atlas."""
@@ -31,15 +136,68 @@ class FTDCService:
         """
         self.auth = HTTPDigestAuth(public_key, private_key)
         self.session = requests.Session()
+        # Same as passing auth=self.auth on every call, but requests added
+        # later cannot forget it. The digest auth instance keeps the server
+        # nonce after the first 401 challenge, per thread.
+        self.session.auth = self.auth
+
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, pool_block=False, max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+
+        # Archive response currently being streamed, so abort() can cut it off
+        self._active_download: Optional[requests.Response] = None
+
+    def _prepare_output_dir(self, output_dir: Optional[Path]) -> Path:
+        """Resolve and create the output directory, checking it is writable.
+
+        Args:
+            output_dir: Requested directory (defaults to current directory)
+
+        Returns:
+            The resolved output directory
+
+        Raises:
+            DownloadError: If the directory cannot be created or written to
+        """
+        output_dir = (output_dir or Path.cwd()).resolve()
+
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise DownloadError(
+                f"Cannot create output directory {output_dir}: {e}"
+            ) from e
+
+        if not os.access(output_dir, os.W_OK):
+            raise DownloadError(f"Output directory is not writable: {output_dir}")
+
+        return output_dir
 
     def get_replica_set(
-        self, group_key: str, replica_set_name: str
+        self,
+        group_key: str,
+        replica_set_name: str,
+        match: MatchMode = MatchMode.CONTAINS,
     ) -> str:
         """Get the replica set name from the cluster processes.
 
+        With ``MatchMode.CONTAINS`` a process matches when the name is a
+        substring of its replica set name or user alias; with
+        ``MatchMode.EXACT`` one of them must equal the name.
+
         Args:
             group_key: MongoDB Atlas project/group ID
             replica_set_name: Target replica set or shard name
+            match: How to compare the name against each process
 
         Returns:
             The actual replica set name
@@ -47,9 +205,30 @@ class FTDCService:
         Raises:
             ReplicaSetNotFoundError: If the replica set cannot be found
         """
+        return self.get_replica_sets(group_key, [replica_set_name], match)[0]
+
+    def get_replica_sets(
+        self,
+        group_key: str,
+        replica_set_names: Sequence[str],
+        match: MatchMode = MatchMode.CONTAINS,
+    ) -> list[str]:
+        """Resolve several replica set names from a single processes lookup.
+
+        Args:
+            group_key: MongoDB Atlas project/group ID
+            replica_set_names: Target replica set or shard names
+            match: How to compare each name against each process
+
+        Returns:
+            The actual replica set names, in the order of ``replica_set_names``
+
+        Raises:
+            ReplicaSetNotFoundError: If any replica set cannot be found
+        """
         url = f"{MONGODB_API_BASE_URL}/{group_key}/processes"
 
-        response = self.session.get(url, auth=self.auth)
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
 
         if response.status_code != 200:
             raise ReplicaSetNotFoundError(
@@ -57,36 +236,54 @@ class FTDCService:
                 f"Response: {response.text}"
             )
 
-        data = response.json()
-        shards = [
-            Shard(
-                user_alias=result.get("userAlias", ""),
-                type_name=result.get("typeName", ""),
-                replica_set_name=result.get("replicaSetName"),
-            )
-            for result in data.get("results", [])
-        ]
+        data: Clusters = json.loads(response.content)
+        shards: list[Shard] = data.get("results", [])
 
-        # Filter shards matching the replica set name
-        matching_shards = [
-            shard
-            for shard in shards
-            if (shard.replica_set_name and replica_set_name in shard.replica_set_name)
-            or replica_set_name in shard.user_alias
+        return [
+            self._match_replica_set(shards, replica_set_name, match)
+            for replica_set_name in replica_set_names
         ]
 
-        if not matching_shards:
-            raise ReplicaSetNotFoundError(
-                f"No replica set found that corresponds to {replica_set_name}"
-            )
+    def _match_replica_set(
+        self, shards: list[Shard], replica_set_name: str, match: MatchMode
+    ) -> str:
+        """Return the replica set name of the first process matching a name.
+
+        Args:
+            shards: Processes from the processes endpoint
+            replica_set_name: Target replica set or shard name
+            match: How to compare the name against each process
+
+        Returns:
+            The actual replica set name
+
+        Raises:
+            ReplicaSetNotFoundError: If no process matches, or the match has
+                no replica set name
+        """
+        exact = match == MatchMode.EXACT
+
+        for shard in shards:
+            name = shard.get("replicaSetName")
+            user_alias = shard.get("userAlias", "")
+
+            if exact:
+                matched = replica_set_name == name or replica_set_name == user_alias
+            else:
+                matched = (
+                    name and replica_set_name in name
+                ) or replica_set_name in user_alias
+
+            if matched:
+                if name:
+                    return name
 
-        # Return the first match's replica set name
-        first_shard = matching_shards[0]
-        if first_shard.replica_set_name:
-            return first_shard.replica_set_name
+                raise ReplicaSetNotFoundError(
+                    f"Replica set name not found in matching shard: {user_alias}"
+                )
 
         raise ReplicaSetNotFoundError(
-            f"Replica set name not found in matching shard: {first_shard.user_alias}"
+            f"No replica set found that corresponds to {replica_set_name}"
         )
 
     def create_ftdc_job(
@@ -107,20 +304,19 @@ class FTDCService:
         """
         url = f"{MONGODB_API_BASE_URL}/{group_key}/logCollectionJobs"
 
-        job = LogCollectionJob.create(replica_set, byte_size)
-        payload = {
-            "resourceType": job.resource_type,
-            "resourceName": job.resource_name,
-            "redacted": job.redacted,
-            "sizeRequestedPerFileBytes": job.size_requested_per_file_bytes,
-            "logTypes": job.log_types,
+        payload: LogCollectionJob = {
+            "resourceType": "REPLICASET",
+            "resourceName": replica_set,
+            "redacted": True,
+            "sizeRequestedPerFileBytes": byte_size,
+            "logTypes": ["FTDC"],
         }
 
         response = self.session.post(
             url,
-            json=payload,
+            data=json.dumps(payload),
             headers={"Content-Type": "application/json; charset=utf-8"},
-            auth=self.auth,
+            timeout=REQUEST_TIMEOUT,
         )
 
         if response.status_code != 201:
@@ -129,18 +325,26 @@ class FTDCService:
                 f"Response: {response.text}"
             )
 
-        data = response.json()
+        data = json.loads(response.content)
         return JobId(id=data["id"])
 
     def check_job_state(
-        self, group_key: str, job_id: str, poll_interval: int = 3
+        self,
+        group_key: str,
+        job_id: str,
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
     ) -> str:
         """Poll the job status until completion.
 
+        The wait between polls starts at ``initial_delay`` and doubles after
+        each in-progress response, up to ``max_delay``.
+
         Args:
             group_key: MongoDB Atlas project/group ID
             job_id: Job identifier
-            poll_interval: Seconds to wait between polls
+            initial_delay: Seconds to wait before the second poll
+            max_delay: Upper bound in seconds for the wait between polls
 
         Returns:
             Download URL for the job
@@ -148,38 +352,184 @@ class FTDCService:
         Raises:
             JobStatusError: If job status check fails or job fails
         """
-        url = f"{MONGODB_API_BASE_URL}/{group_key}/logCollectionJobs/{job_id}"
+        return self.wait_for_jobs(group_key, [job_id], initial_delay, max_delay)[
+            job_id
+        ]
+
+    def wait_for_jobs(
+        self,
+        group_key: str,
+        job_ids: Sequence[str],
+        initial_delay: float = 1.0,
+        max_delay: float = 30.0,
+        cancel: Optional[threading.Event] = None,
+    ) -> dict[str, str]:
+        """Poll several jobs in one loop until all of them complete.
+
+        Each cycle checks every unfinished job once and then sleeps once, with
+        the same backoff as ``check_job_state``.
+
+        Args:
+            group_key: MongoDB Atlas project/group ID
+            job_ids: Job identifiers
+            initial_delay: Seconds to wait before the second poll cycle
+            max_delay: Upper bound in seconds for the wait between cycles
+            cancel: Optional event that stops polling as soon as it is set
+
+        Returns:
+            Download URL for each job, keyed by job ID
+
+        Raises:
+            JobStatusError: If a job status check fails or any job fails
+            DownloadCancelledError: If cancel is set before the jobs finish
+        """
+        download_urls: dict[str, str] = {}
+        pending = list(job_ids)
+        delay = initial_delay
 
         while True:
-            response = self.session.get(url, auth=self.auth)
+            for job_id in pending:
+                download_url = self._poll_job_state(group_key, job_id)
+                if download_url is not None:
+                    download_urls[job_id] = download_url
+
+            pending = [job_id for job_id in pending if job_id not in download_urls]
+            if not pending:
+                return download_urls
+
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                raise DownloadCancelledError("Download cancelled")
+            delay = min(delay * 2, max_delay)
+
+    def _poll_job_state(self, group_key: str, job_id: str) -> Optional[str]:
+        """Check a job's status once.
+
+        Args:
+            group_key: MongoDB Atlas project/group ID
+            job_id: Job identifier
+
+        Returns:
+            The download URL once the job has completed, or None while it is
+            still in progress
+
+        Raises:
+            JobStatusError: If the status check fails or the job failed
+        """
+        url = f"{MONGODB_API_BASE_URL}/{group_key}/logCollectionJobs/{job_id}"
+
+        # The session's digest auth already reuses the nonce from the first
+        # challenge, so polls carry no 401 round-trip. The header itself can't
+        # be cached: its response hash covers the nonce count, which must
+        # change on every request.
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+
+        if response.status_code != 200:
+            raise JobStatusError(
+                f"Failed to check job status. Status: {response.status_code}, "
+                f"Response: {response.text}"
+            )
+
+        data = json.loads(response.content)
+        status = data.get("status", "")
+
+        if status == JobState.IN_PROGRESS.value:
+            logger.info("Job %s is still in progress...", job_id)
+            return None
+        elif status in (JobState.SUCCESS.value, JobState.MARKED_FOR_EXPIRY.value):
+            logger.info("Job %s completed successfully!", job_id)
+            return data.get("downloadUrl", "")
+        elif status in (JobState.FAILURE.value, JobState.EXPIRED.value):
+            raise JobStatusError(
+                f"Job {job_id} failed with status: {status}"
+            )
+        else:
+            raise JobStatusError(
+                f"Unknown job status: {status}"
+            )
+
+    @contextmanager
+    def _open_download(
+        self, group_key: str, job_id: str
+    ) -> Iterator[requests.Response]:
+        """Stream the FTDC archive for a finished job.
+
+        The response is closed on exit and can be cut off from another thread
+        with abort() while it is open.
+
+        Args:
+            group_key: MongoDB Atlas project/group ID
+            job_id: Job identifier
+
+        Yields:
+            The streaming response
+
+        Raises:
+            DownloadError: If the download request fails
+        """
+        url = f"{MONGODB_API_BASE_URL}/{group_key}/logCollectionJobs/{job_id}/download"
 
+        with self.session.get(
+            url, stream=True, timeout=REQUEST_TIMEOUT
+        ) as response:
             if response.status_code != 200:
-                raise JobStatusError(
-                    f"Failed to check job status. Status: {response.status_code}, "
-                    f"Response: {response.text}"
+                raise DownloadError(
+                    f"Failed to download FTDC data. Status: {response.status_code}, "
+                    f"URL: {url}"
                 )
 
-            data = response.json()
-            status = data.get("status", "")
-
-            if status == JobState.IN_PROGRESS.value:
-                print(f"Job {job_id} is still in progress...")
-                time.sleep(poll_interval)
-                continue
-            elif status in (JobState.SUCCESS.value, JobState.MARKED_FOR_EXPIRY.value):
-                print(f"Job {job_id} completed successfully!")
-                return data.get("downloadUrl", "")
-            elif status in (JobState.FAILURE.value, JobState.EXPIRED.value):
-                raise JobStatusError(
-                    f"Job {job_id} failed with status: {status}"
-                )
-            else:
-                raise JobStatusError(
-                    f"Unknown job status: {status}"
-                )
+            self._active_download = response
+            try:
+                yield response
+            finally:
+                self._active_download = None
+
+    def abort(self) -> None:
+        """Cut off the archive transfer in progress, if any.
+
+        Meant to be called from another thread after setting the cancel event
+        passed to the download, so the interrupted read surfaces as
+        DownloadCancelledError. The downloading thread still closes the
+        response; the session and its other pooled connections stay usable.
+        """
+        response = self._active_download
+        if response is not None:
+            # Unlike close(), shutdown() also wakes a read blocked in another
+            # thread. It fails once urllib3 has read the whole body and
+            # released the connection, or for a response without a socket;
+            # the cancel event then stops the download at its next read.
+            try:
+                response.raw.shutdown()
+            except (RuntimeError, ValueError):
+                pass
+
+    @staticmethod
+    def _check_disk_space(response: requests.Response, output_dir: Path) -> None:
+        """Refuse a download up front if the archive would not fit on disk.
+
+        Keeps 10% headroom for filesystem overhead. Responses without a
+        Content-Length are not checked.
+
+        Raises:
+            DownloadError: If output_dir lacks room for the archive
+        """
+        size = int(response.headers.get("Content-Length", 0))
+        free = shutil.disk_usage(output_dir).free
+        if size and size * 1.1 > free:
+            raise DownloadError(
+                f"Not enough disk space for FTDC data: archive is {size} "
+                f"bytes, {free} bytes free in {output_dir}"
+            )
 
     def download_ftdc_data(
-        self, group_key: str, job_id: str, replica_set: str, output_dir: Path
+        self,
+        group_key: str,
+        job_id: str,
+        replica_set: str,
+        output_dir: Path,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> Path:
         """Download the FTDC data file.
 
@@ -188,34 +538,156 @@ class FTDCService:
             job_id: Job identifier
             replica_set: Replica set name
             output_dir: Directory to save the file
+            progress: Optional callback reporting bytes received
+            cancel: Optional event that stops the download once set
 
         Returns:
             Path to the downloaded file
 
         Raises:
-            DownloadError: If download fails
+            DownloadError: If download fails or the archive does not fit on disk
+            DownloadCancelledError: If cancel is set before the download ends
         """
-        url = f"{MONGODB_API_BASE_URL}/{group_key}/logCollectionJobs/{job_id}/download"
+        filename = f"ftdc_data_{replica_set}_job_{job_id}.tar.gz"
+        file_path = output_dir / filename
 
-        response = self.session.get(url, auth=self.auth, stream=True)
+        _check_cancelled(cancel)
+        logger.info("Downloading FTDC data for job %s...", job_id)
 
-        if response.status_code != 200:
-            raise DownloadError(
-                f"Failed to download FTDC data. Status: {response.status_code}, "
-                f"URL: {url}"
+        with self._open_download(group_key, job_id) as response:
+            self._check_disk_space(response, output_dir)
+
+            response.raw.decode_content = True
+            source = (
+                response.raw
+                if progress is None and cancel is None
+                else _DownloadReader(response, job_id, progress, cancel)
             )
+            # Write through a raw descriptor: the chunks are already large, so a
+            # BufferedWriter would only add a copy per chunk.
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            fd = os.open(file_path, flags, 0o666)
+            try:
+                try:
+                    while chunk := source.read(DOWNLOAD_CHUNK_SIZE):
+                        view = memoryview(chunk)
+                        while view:
+                            view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            except BaseException:
+                file_path.unlink(missing_ok=True)
+                raise
+
+        logger.info("Download complete!")
+        return file_path
 
-        filename = f"ftdc_data_{replica_set}_job_{job_id}.tar.gz"
-        file_path = output_dir / filename
+    @contextmanager
+    def stream_ftdc_data(
+        self,
+        group_key: str,
+        job_id: str,
+        progress: Optional[ProgressCallback] = None,
+        output_dir: Optional[Path] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Iterator[tarfile.TarFile]:
+        """Open the FTDC archive as a tar stream straight off the network.
 
-        print(f"Downloading FTDC data for job {job_id}...")
+        The archive is decompressed as it arrives and never touches the disk.
+        The returned TarFile is in streaming mode, so members must be read in
+        order.
 
-        with open(file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        Args:
+            group_key: MongoDB Atlas project/group ID
+            job_id: Job identifier
+            progress: Optional callback reporting bytes received
+            output_dir: Directory the members will be written to; if given,
+                fail early when it cannot hold the compressed archive
+            cancel: Optional event that stops the download once set
 
-        print(f"Download complete!")
-        return file_path
+        Yields:
+            TarFile reading the archive members sequentially
+
+        Raises:
+            DownloadError: If the download fails or the archive is malformed
+            DownloadCancelledError: If cancel is set before the archive is read
+        """
+        _check_cancelled(cancel)
+
+        with self._open_download(group_key, job_id) as response:
+            if output_dir is not None:
+                self._check_disk_space(response, output_dir)
+
+            # Undo any HTTP Content-Encoding; the archive's own gzip layer is
+            # handled below.
+            response.raw.decode_content = True
+            source = (
+                response.raw
+                if progress is None and cancel is None
+                else _DownloadReader(response, job_id, progress, cancel)
+            )
+            # Only malformed or truncated archive data is reported as a read
+            # failure; OSErrors from the caller's writes (ENOSPC, EACCES, ...)
+            # pass through unchanged.
+            try:
+                with gzip.GzipFile(fileobj=source) as gz:
+                    with tarfile.open(
+                        fileobj=gz, mode="r|", bufsize=DOWNLOAD_CHUNK_SIZE
+                    ) as tar:
+                        yield tar
+            except (
+                EOFError, gzip.BadGzipFile, inflate_error, tarfile.TarError
+            ) as e:
+                raise DownloadError(
+                    f"Failed to read FTDC archive for job {job_id}: {e}"
+                ) from e
+
+    def extract_ftdc_data(
+        self,
+        group_key: str,
+        job_id: str,
+        replica_set: str,
+        output_dir: Path,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Path:
+        """Download and extract the FTDC data without saving the tar.gz.
+
+        Args:
+            group_key: MongoDB Atlas project/group ID
+            job_id: Job identifier
+            replica_set: Replica set name
+            output_dir: Directory to extract into
+            progress: Optional callback reporting bytes received
+            cancel: Optional event that stops the download once set
+
+        Returns:
+            Path to the directory holding the extracted files
+
+        Raises:
+            DownloadError: If download or extraction fails, or the archive
+                does not fit on disk
+            DownloadCancelledError: If cancel is set before extraction ends
+        """
+        extract_dir = output_dir / f"ftdc_data_{replica_set}_job_{job_id}"
+        created = not extract_dir.exists()
+
+        logger.info("Downloading and extracting FTDC data for job %s...", job_id)
+
+        # The compressed size is only a lower bound for the extracted data, so
+        # a partial extraction is still possible; never leave one behind.
+        try:
+            with self.stream_ftdc_data(
+                group_key, job_id, progress, output_dir, cancel
+            ) as tar:
+                tar.extractall(extract_dir, filter="data")
+        except BaseException:
+            if created:
+                shutil.rmtree(extract_dir, ignore_errors=True)
+            raise
+
+        logger.info("Extraction complete!")
+        return extract_dir
 
     def get_ftdc_data(
         self,
@@ -223,6 +695,10 @@ class FTDCService:
         replica_set_name: str,
         byte_size: int = 10_000_000,
         output_dir: Optional[Path] = None,
+        extract: bool = False,
+        match: MatchMode = MatchMode.CONTAINS,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[threading.Event] = None,
     ) -> Path:
         """Main method to orchestrate FTDC data download.
 
@@ -231,28 +707,101 @@ class FTDCService:
             replica_set_name: Target replica set or shard name
             byte_size: Size of data to collect in bytes
             output_dir: Directory to save the file (defaults to current directory)
+            extract: Extract the archive while downloading instead of saving
+                the tar.gz
+            match: How to match replica_set_name against Atlas processes
+            progress: Optional callback reporting bytes received
+            cancel: Optional event that stops the work once set
 
         Returns:
-            Path to the downloaded file
+            Path to the downloaded file, or to the extraction directory
+        """
+        return self.get_ftdc_data_for_replica_sets(
+            group_key=group_key,
+            replica_set_names=[replica_set_name],
+            byte_size=byte_size,
+            output_dir=output_dir,
+            extract=extract,
+            match=match,
+            progress=progress,
+            cancel=cancel,
+        )[0]
+
+    def get_ftdc_data_for_replica_sets(
+        self,
+        group_key: str,
+        replica_set_names: Sequence[str],
+        byte_size: int = 10_000_000,
+        output_dir: Optional[Path] = None,
+        extract: bool = False,
+        match: MatchMode = MatchMode.CONTAINS,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> list[Path]:
+        """Download FTDC data for several replica sets in one batch.
+
+        The processes are looked up once for all names and every job is
+        created before polling starts, so Atlas collects the jobs side by side
+        while a single loop polls them. Archives are downloaded one after
+        another once all jobs are ready. Names that resolve to the same
+        replica set share one job.
+
+        Args:
+            group_key: MongoDB Atlas project/group ID
+            replica_set_names: Target replica set or shard names
+            byte_size: Size of data to collect in bytes
+            output_dir: Directory to save the files (defaults to current directory)
+            extract: Extract the archives while downloading instead of saving
+                the tar.gz files
+            match: How to match each name against Atlas processes
+            progress: Optional callback reporting bytes received, shared by
+                all downloads
+            cancel: Optional event that stops the batch once set; jobs
+                already created on Atlas are left to finish there
+
+        Returns:
+            Paths to the downloaded files, one per distinct replica set
+
+        Raises:
+            DownloadCancelledError: If cancel is set before the batch ends
         """
-        if output_dir is None:
-            output_dir = Path.cwd()
+        if not replica_set_names:
+            return []
 
-        # Step 1: Get replica set
-        print(f"Looking for replica set: {replica_set_name}")
-        replica_set = self.get_replica_set(group_key, replica_set_name)
-        print(f"Found replica set: {replica_set}")
+        # Fail before any Atlas calls rather than after a long download
+        output_dir = self._prepare_output_dir(output_dir)
 
-        # Step 2: Create FTDC job
-        print("Creating FTDC collection job...")
-        job = self.create_ftdc_job(group_key, replica_set, byte_size)
-        print(f"Job created with ID: {job.id}")
+        # Step 1: Get replica sets
+        logger.info("Looking for replica sets: %s", ", ".join(replica_set_names))
+        replica_sets = list(
+            dict.fromkeys(self.get_replica_sets(group_key, replica_set_names, match))
+        )
+        logger.info("Found replica sets: %s", ", ".join(replica_sets))
+
+        # Step 2: Create FTDC jobs
+        jobs = []
+        for replica_set in replica_sets:
+            _check_cancelled(cancel)
+            logger.info("Creating FTDC collection job for %s...", replica_set)
+            job = self.create_ftdc_job(group_key, replica_set, byte_size)
+            logger.info("Job created with ID: %s", job.id)
+            jobs.append((replica_set, job))
 
         # Step 3: Poll job status
-        print("Checking job status...")
-        self.check_job_state(group_key, job.id)
+        logger.info("Checking job status...")
+        self.wait_for_jobs(group_key, [job.id for _, job in jobs], cancel=cancel)
 
         # Step 4: Download data
-        file_path = self.download_ftdc_data(group_key, job.id, replica_set, output_dir)
+        file_paths = []
+        for replica_set, job in jobs:
+            if extract:
+                file_path = self.extract_ftdc_data(
+                    group_key, job.id, replica_set, output_dir, progress, cancel
+                )
+            else:
+                file_path = self.download_ftdc_data(
+                    group_key, job.id, replica_set, output_dir, progress, cancel
+                )
+            file_paths.append(file_path)
 
-        return file_path
+        return file_paths
@@ -0,0 +1,341 @@
+"""Tests for the FTDC download service."""
+
+import gzip as stdlib_gzip
+import io
+import json
+import random
+import tarfile
+import threading
+import time
+import zlib
+from types import SimpleNamespace
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+from ftdc import service as service_module
+from ftdc.errors import (
+    DownloadCancelledError,
+    DownloadError,
+    JobStatusError,
+    ReplicaSetNotFoundError,
+)
+from ftdc.models import MatchMode
+from ftdc.service import FTDCService
+
+
+def make_archive(members: dict[str, bytes]) -> bytes:
+    """Build an in-memory tar.gz with the given member names and contents."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class ArchiveAdapter(BaseAdapter):
+    """Transport adapter that answers every request with a fixed archive."""
+
+    def __init__(self, body: bytes, sock_shutdown=None):
+        super().__init__()
+        self.body = body
+        self.sock_shutdown = sock_shutdown
+        self.timeouts = []
+
+    def send(self, request, **kwargs) -> requests.Response:
+        self.timeouts.append(kwargs.get("timeout"))
+        raw = HTTPResponse(
+            body=io.BytesIO(self.body),
+            headers={"Content-Length": str(len(self.body))},
+            status=200,
+            preload_content=False,
+        )
+        raw._sock_shutdown = self.sock_shutdown
+        return HTTPAdapter().build_response(request, raw)
+
+    def close(self) -> None:
+        pass
+
+
+class AtlasAdapter(BaseAdapter):
+    """Transport adapter that fakes the Atlas endpoints by URL.
+
+    Jobs are named after the replica set they collect. Each status poll takes
+    the next entry from that job's statuses, repeating the last one.
+    """
+
+    def __init__(self, processes: list[dict], statuses: dict[str, list[str]]):
+        super().__init__()
+        self.processes = processes
+        self.statuses = statuses
+        self.requests: list[tuple[str, str]] = []
+
+    def send(self, request, **kwargs) -> requests.Response:
+        path = request.path_url.removeprefix("/api/atlas/v1.0/groups/group")
+        self.requests.append((request.method, path))
+
+        if path == "/processes":
+            return self._respond(request, 200, {"results": self.processes})
+        if request.method == "POST" and path == "/logCollectionJobs":
+            job_id = "job-" + json.loads(request.body)["resourceName"]
+            return self._respond(request, 201, {"id": job_id})
+
+        job_id = path.split("/")[2]
+        if path.endswith("/download"):
+            return self._respond(request, 200, make_archive({job_id: b"ftdc"}))
+        statuses = self.statuses[job_id]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return self._respond(request, 200, {"status": status, "downloadUrl": "url"})
+
+    def _respond(self, request, status: int, body) -> requests.Response:
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers={"Content-Length": str(len(body))},
+            status=status,
+            preload_content=False,
+        )
+        return HTTPAdapter().build_response(request, raw)
+
+    def close(self) -> None:
+        pass
+
+
+PROCESSES = [
+    {
+        "userAlias": "cluster0-shard-00-00.abc.mongodb.net",
+        "typeName": "REPLICA_PRIMARY",
+        "replicaSetName": "atlas-abc-shard-0",
+    },
+    {
+        "userAlias": "cluster0-shard-01-00.abc.mongodb.net",
+        "typeName": "REPLICA_PRIMARY",
+        "replicaSetName": "atlas-abc-shard-1",
+    },
+    {
+        "userAlias": "cluster0-config-00-00.abc.mongodb.net",
+        "typeName": "REPLICA_PRIMARY",
+    },
+]
+
+
+@pytest.mark.parametrize("backend", ["stdlib", "isal"])
+def test_stream_ftdc_data_reports_progress(monkeypatch, backend):
+    if backend == "isal":
+        gzip_module = pytest.importorskip("isal.igzip")
+        inflate_error = pytest.importorskip("isal.isal_zlib").error
+    else:
+        gzip_module = stdlib_gzip
+        inflate_error = zlib.error
+
+    members = {
+        "mongodb-logfiles/diagnostic.data/metrics.0": bytes(range(256)) * 4096,
+        "mongodb-logfiles/diagnostic.data/metrics.1": b"ftdc" * 100_000,
+    }
+    archive = make_archive(members)
+    monkeypatch.setattr(service_module, "gzip", gzip_module)
+    monkeypatch.setattr(service_module, "inflate_error", inflate_error)
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", ArchiveAdapter(archive))
+
+    reports = []
+    extracted = {}
+    with service.stream_ftdc_data(
+        "group", "job", lambda *report: reports.append(report)
+    ) as tar:
+        for member in tar:
+            extracted[member.name] = tar.extractfile(member).read()
+
+    assert extracted == members
+    assert reports
+    assert all(job_id == "job" for job_id, _, _ in reports)
+    assert reports[-1][1:] == (len(archive), len(archive))
+
+
+def test_extract_ftdc_data_removes_partial_extraction(tmp_path):
+    # Incompressible data, larger than the stream buffer, so the cut lands
+    # after extraction has started writing the member.
+    archive = make_archive({"metrics.0": random.Random(0).randbytes(4_000_000)})
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", ArchiveAdapter(archive[: len(archive) // 2]))
+
+    with pytest.raises(DownloadError):
+        service.extract_ftdc_data("group", "job", "rs0", tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_extract_ftdc_data_checks_disk_space(monkeypatch, tmp_path):
+    archive = make_archive({"metrics.0": b"ftdc"})
+    monkeypatch.setattr(
+        service_module.shutil, "disk_usage", lambda path: SimpleNamespace(free=0)
+    )
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", ArchiveAdapter(archive))
+
+    with pytest.raises(DownloadError, match="Not enough disk space"):
+        service.extract_ftdc_data("group", "job", "rs0", tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_ftdc_data_stops_when_cancelled(tmp_path):
+    archive = make_archive({"metrics.0": random.Random(0).randbytes(4_000_000)})
+    cancel = threading.Event()
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", ArchiveAdapter(archive))
+
+    with pytest.raises(DownloadCancelledError):
+        service.download_ftdc_data(
+            "group", "job", "rs0", tmp_path, lambda *report: cancel.set(), cancel
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_ftdc_data_sets_timeout(tmp_path):
+    adapter = ArchiveAdapter(make_archive({"metrics.0": b"ftdc"}))
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", adapter)
+    service.download_ftdc_data("group", "job", "rs0", tmp_path)
+
+    assert adapter.timeouts == [service_module.REQUEST_TIMEOUT]
+
+
+@pytest.mark.parametrize(
+    "sock_shutdown",
+    # Without a socket shutdown() raises ValueError; with one but no
+    # connection left, as after the body is read, it raises RuntimeError
+    [None, lambda how: None],
+    ids=["no-socket", "released"],
+)
+def test_abort_after_body_is_read(tmp_path, sock_shutdown):
+    archive = make_archive({"metrics.0": random.Random(0).randbytes(100_000)})
+    cancel = threading.Event()
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", ArchiveAdapter(archive, sock_shutdown))
+
+    def progress(job_id: str, received: int, total: int) -> None:
+        if received == total:
+            cancel.set()
+            service.abort()
+
+    with pytest.raises(DownloadCancelledError):
+        service.download_ftdc_data("group", "job", "rs0", tmp_path, progress, cancel)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_wait_for_jobs_stops_when_cancelled(monkeypatch):
+    service = FTDCService("public", "private")
+    monkeypatch.setattr(service, "_poll_job_state", lambda group_key, job_id: None)
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+
+    started = time.monotonic()
+    with pytest.raises(DownloadCancelledError):
+        service.wait_for_jobs("group", ["job"], initial_delay=30.0, cancel=cancel)
+
+    assert time.monotonic() - started < 5
+
+
+@pytest.mark.parametrize(
+    ("name", "match", "replica_set", "error"),
+    [
+        # Exact hits on replicaSetName and on userAlias
+        ("atlas-abc-shard-0", MatchMode.EXACT, "atlas-abc-shard-0", None),
+        (
+            "cluster0-shard-01-00.abc.mongodb.net",
+            MatchMode.EXACT,
+            "atlas-abc-shard-1",
+            None,
+        ),
+        # A substring is not an exact match
+        ("shard-00", MatchMode.EXACT, None, "No replica set found"),
+        ("shard-01", MatchMode.CONTAINS, "atlas-abc-shard-1", None),
+        # The config server process has no replicaSetName
+        ("config-00", MatchMode.CONTAINS, None, "Replica set name not found"),
+    ],
+)
+def test_get_replica_sets_matching(name, match, replica_set, error):
+    service = FTDCService("public", "private")
+    service.session.mount("https://", AtlasAdapter(PROCESSES, {}))
+
+    if error is None:
+        assert service.get_replica_sets("group", [name], match) == [replica_set]
+    else:
+        with pytest.raises(ReplicaSetNotFoundError, match=error):
+            service.get_replica_sets("group", [name], match)
+
+
+def test_get_ftdc_data_for_replica_sets_batches_jobs(monkeypatch, tmp_path):
+    adapter = AtlasAdapter(
+        PROCESSES,
+        {
+            "job-atlas-abc-shard-1": ["IN_PROGRESS", "IN_PROGRESS", "SUCCESS"],
+            "job-atlas-abc-shard-0": ["IN_PROGRESS", "SUCCESS"],
+        },
+    )
+    sleeps = []
+    monkeypatch.setattr(service_module.time, "sleep", sleeps.append)
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", adapter)
+
+    # The first and last names resolve to the same replica set
+    paths = service.get_ftdc_data_for_replica_sets(
+        "group", ["shard-01", "shard-00", "atlas-abc-shard-1"], output_dir=tmp_path
+    )
+
+    assert paths == [
+        tmp_path / "ftdc_data_atlas-abc-shard-1_job_job-atlas-abc-shard-1.tar.gz",
+        tmp_path / "ftdc_data_atlas-abc-shard-0_job_job-atlas-abc-shard-0.tar.gz",
+    ]
+    assert all(path.is_file() for path in paths)
+    assert adapter.requests == [
+        ("GET", "/processes"),
+        ("POST", "/logCollectionJobs"),
+        ("POST", "/logCollectionJobs"),
+        ("GET", "/logCollectionJobs/job-atlas-abc-shard-1"),
+        ("GET", "/logCollectionJobs/job-atlas-abc-shard-0"),
+        ("GET", "/logCollectionJobs/job-atlas-abc-shard-1"),
+        ("GET", "/logCollectionJobs/job-atlas-abc-shard-0"),
+        ("GET", "/logCollectionJobs/job-atlas-abc-shard-1"),
+        ("GET", "/logCollectionJobs/job-atlas-abc-shard-1/download"),
+        ("GET", "/logCollectionJobs/job-atlas-abc-shard-0/download"),
+    ]
+    # One sleep per poll cycle, not per job, with the delay doubling
+    assert sleeps == [1.0, 2.0]
+
+
+def test_get_ftdc_data_for_replica_sets_stops_on_failed_job(monkeypatch, tmp_path):
+    adapter = AtlasAdapter(
+        PROCESSES,
+        {
+            "job-atlas-abc-shard-0": ["IN_PROGRESS"],
+            "job-atlas-abc-shard-1": ["FAILURE"],
+        },
+    )
+    monkeypatch.setattr(service_module.time, "sleep", lambda delay: None)
+
+    service = FTDCService("public", "private")
+    service.session.mount("https://", adapter)
+
+    with pytest.raises(JobStatusError, match="job-atlas-abc-shard-1 failed"):
+        service.get_ftdc_data_for_replica_sets(
+            "group", ["shard-00", "shard-01"], output_dir=tmp_path
+        )
+
+    assert not any(path.endswith("/download") for _, path in adapter.requests)
+    assert list(tmp_path.iterdir()) == []